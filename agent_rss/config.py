@@ -1,5 +1,6 @@
 """Configuration loading for agent-rss."""
 
+import copy
 import os
 import re
 from pathlib import Path
@@ -7,16 +8,41 @@ from typing import Any
 
 import yaml
 
+# Prefer libyaml's C loader when available (~10x faster than the pure-Python
+# SafeLoader); fall back gracefully if PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Compiled once at import; expand_env_vars runs for every string leaf in the
+# config, so avoid re-resolving the pattern and re-creating the replacer per call.
+_ENV_VAR_RE = re.compile(r'\$\{(\w+)\}')
+
+
+def _env_replace(match: re.Match) -> str:
+    return os.environ.get(match.group(1), match.group(0))
+
 
 def expand_env_vars(value: str) -> str:
     """Expand environment variables in a string."""
-    pattern = r'\$\{(\w+)\}'
+    # Most config strings contain no placeholder; a substring probe is far
+    # cheaper than a no-match run of the regex engine.
+    if '$' not in value:
+        return value
+    return _ENV_VAR_RE.sub(_env_replace, value)
+
 
-    def replace(match):
-        var_name = match.group(1)
-        return os.environ.get(var_name, match.group(0))
+# Memoization for small files that are re-read within a process (CLI
+# subcommands, repeated runs). Keyed on (resolved path, mtime, size) so edits
+# on disk invalidate the cached parse automatically.
+_file_cache: dict[tuple, Any] = {}
 
-    return re.sub(pattern, replace, value)
+
+def _cache_key(path: Path) -> tuple:
+    st = os.stat(path)
+    return (str(path.resolve()), st.st_mtime_ns, st.st_size)
 
 
 def expand_config(obj: Any) -> Any:
@@ -48,10 +74,20 @@ def load_config(config_path: Path | str) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    key = _cache_key(config_path)
+    cached = _file_cache.get(key)
+    if cached is not None:
+        # Deep-copy so callers mutating the config don't poison the cache
+        return copy.deepcopy(cached)
+
+    # Binary mode lets the (C) loader do its own buffered UTF-8 decoding
+    # instead of going through Python's TextIOWrapper.
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
 
-    return expand_config(config)
+    config = expand_config(config)
+    _file_cache[key] = copy.deepcopy(config)
+    return config
 
 
 def parse_rss_list(rss_list_path: Path | str) -> list[str]:
@@ -105,29 +141,44 @@ def parse_rss_list_grouped(rss_list_path: Path | str) -> dict[str, list[str]]:
     if not rss_list_path.exists():
         raise FileNotFoundError(f"RSS list file not found: {rss_list_path}")
 
-    groups: dict[str, list[str]] = {}
-    current_group = "default"
+    key = _cache_key(rss_list_path)
+    cached = _file_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    # Pre-create the default group so the append path never needs a
+    # membership check; dropped at the end if it stayed empty.
+    groups: dict[str, list[str]] = {"default": []}
+    current = groups["default"]
 
     with open(rss_list_path) as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-            # Check for group header (# Group Name)
-            if line.startswith('#'):
-                current_group = line[1:].strip().lower()
-                if current_group not in groups:
-                    groups[current_group] = []
-                continue
-            # Extract URLs (handle markdown list format)
-            if line.startswith('- '):
-                line = line[2:].strip()
+        data = f.read()
+
+    # Single pass over the whole (tiny) file, dispatching on the first
+    # character instead of running several startswith probes per line.
+    for raw in data.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        head = line[0]
+        if head == '#':
+            # Group header (# Group Name)
+            group_name = line[1:].strip().lower()
+            current = groups.setdefault(group_name, [])
+        elif head == '-':
+            # Markdown list item (- url)
+            url = line[2:].strip()
+            if url.startswith('http'):
+                current.append(url)
+        elif head == 'h':
+            # Bare URL
             if line.startswith('http'):
-                if current_group not in groups:
-                    groups[current_group] = []
-                groups[current_group].append(line)
+                current.append(line)
 
+    if not groups["default"]:
+        del groups["default"]
+
+    _file_cache[key] = copy.deepcopy(groups)
     return groups
 
 
@@ -149,8 +200,25 @@ def load_interests(interests_path: Path | str) -> str:
     if not interests_path.exists():
         raise FileNotFoundError(f"Interests file not found: {interests_path}")
 
+    key = _cache_key(interests_path)
+    cached = _file_cache.get(key)
+    if cached is not None:
+        # Strings are immutable; safe to return the cached value directly
+        return cached
+
     with open(interests_path) as f:
-        return f.read().strip()
+        interests = f.read().strip()
+
+    _file_cache[key] = interests
+    return interests
+
+
+# Field-line prefixes recognized inside an example block
+_FIELD_PREFIXES = {
+    '- **Title**:': 'title',
+    '- **Abstract**:': 'abstract',
+    '- **Reason**:': 'reason',
+}
 
 
 def parse_examples(examples_path: Path | str) -> dict:
@@ -187,46 +255,45 @@ def parse_examples(examples_path: Path | str) -> dict:
     if not examples_path.exists():
         return result
 
-    with open(examples_path) as f:
-        content = f.read().strip()
-
-    if not content:
-        return result
-
     current_section = None  # "liked" or "disliked"
     current_example = {}
 
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
+    # Iterate the file directly instead of materializing the whole
+    # content string and a split list
+    with open(examples_path) as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
 
-        # Section headers
-        line_lower = line.lower()
-        if line.startswith('# ') and 'liked' in line_lower and 'disliked' not in line_lower:
-            # Save previous example if exists
-            if current_example.get('title'):
-                result[current_section].append(current_example)
-            current_section = "liked"
-            current_example = {}
-        elif line.startswith('# ') and 'disliked' in line_lower:
-            if current_example.get('title'):
-                result[current_section].append(current_example)
-            current_section = "disliked"
-            current_example = {}
-        elif line.startswith('## '):
-            # New example within section
-            if current_example.get('title') and current_section:
-                result[current_section].append(current_example)
-            current_example = {}
-        elif current_section:
-            # Parse example fields
-            if line.startswith('- **Title**:'):
-                current_example['title'] = line.split(':', 1)[1].strip()
-            elif line.startswith('- **Abstract**:'):
-                current_example['abstract'] = line.split(':', 1)[1].strip()
-            elif line.startswith('- **Reason**:'):
-                current_example['reason'] = line.split(':', 1)[1].strip()
+            # One slice identifies the line kind; deeper prefix checks only
+            # run inside the matching branch
+            head = line[:3]
+            if head == '## ':
+                # New example within section
+                if current_example.get('title') and current_section:
+                    result[current_section].append(current_example)
+                current_example = {}
+            elif head.startswith('# '):
+                # Section header; ignore headers naming neither section
+                line_lower = line.lower()
+                if 'disliked' in line_lower:
+                    section = "disliked"
+                elif 'liked' in line_lower:
+                    section = "liked"
+                else:
+                    continue
+                # Save previous example if exists
+                if current_example.get('title'):
+                    result[current_section].append(current_example)
+                current_section = section
+                current_example = {}
+            elif head == '- *' and current_section:
+                # Parse example fields via the prefix table
+                for prefix, key in _FIELD_PREFIXES.items():
+                    if line.startswith(prefix):
+                        current_example[key] = line[len(prefix):].strip()
+                        break
 
     # Save last example
     if current_example.get('title') and current_section:
@@ -2,6 +2,7 @@
 
 import logging
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -24,10 +25,24 @@ class PaperDatabase:
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
+        # One connection reused for the life of the instance; reopening per
+        # query pays connection setup and page-cache warmup every time.
+        # check_same_thread=False plus the write lock makes it safe to call
+        # from worker threads.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._lock = threading.Lock()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
         with sqlite3.connect(self.db_path) as conn:
+            # WAL + NORMAL sync cuts per-commit fsync cost while staying
+            # crash-safe; both settings persist in the database file.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS papers (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -51,12 +66,46 @@ class PaperDatabase:
                     conn.execute(f"ALTER TABLE papers ADD COLUMN {col} {col_type}")
                 except sqlite3.OperationalError:
                     pass
+            # Pending provider batch jobs (--batch mode); payload holds the
+            # JSON-encoded paper metadata needed to collect results later
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS batch_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT DEFAULT 'pending',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            # Exact-hash cache of LLM responses keyed by prompt digest;
+            # identical prompts (reruns, cross-listed papers) skip the API
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS prompt_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT,
+                    ts INTEGER
+                )
+            """)
+            # HTTP cache validators per feed, for conditional GETs
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_meta (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    modified TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_paper_url ON papers(paper_url)
             """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_processed_at ON papers(processed_at)
             """)
+            # Matches get_recent_relevant's WHERE + ORDER BY directly,
+            # avoiding a full scan followed by a temporary sort
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_relevant_processed ON papers(is_relevant, processed_at DESC)
+            """)
             conn.commit()
 
     def is_processed(self, paper_url: str) -> bool:
@@ -73,12 +122,192 @@ class PaperDatabase:
         bool
             True if paper has been processed
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM papers WHERE paper_url = ?",
-                (paper_url,)
+        cursor = self._conn.execute(
+            "SELECT 1 FROM papers WHERE paper_url = ?",
+            (paper_url,)
+        )
+        return cursor.fetchone() is not None
+
+    def get_cached_response(self, key: str) -> Optional[str]:
+        """
+        Look up a cached LLM response by prompt digest.
+
+        Parameters
+        ----------
+        key : str
+            Prompt hash
+
+        Returns
+        -------
+        str | None
+            Cached response text, or None on miss
+        """
+        row = self._conn.execute(
+            "SELECT response FROM prompt_cache WHERE key = ?",
+            (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def cache_response(self, key: str, response: str) -> None:
+        """
+        Store an LLM response under its prompt digest.
+
+        Parameters
+        ----------
+        key : str
+            Prompt hash
+        response : str
+            Response text to cache
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(datetime.now().timestamp()))
+            )
+            self._conn.commit()
+
+    def save_batch_job(self, job_id: str, provider: str, payload: str) -> None:
+        """
+        Record a submitted provider batch job.
+
+        Parameters
+        ----------
+        job_id : str
+            Provider-assigned batch job id
+        provider : str
+            LLM provider name ('claude', 'openai', ...)
+        payload : str
+            JSON-encoded paper metadata, in submission order
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batch_jobs (job_id, provider, payload, status, created_at) VALUES (?, ?, ?, 'pending', ?)",
+                (job_id, provider, payload, datetime.now())
+            )
+            self._conn.commit()
+
+    def get_batch_job(self, job_id: str) -> Optional[dict]:
+        """
+        Get a recorded batch job.
+
+        Parameters
+        ----------
+        job_id : str
+            Provider-assigned batch job id
+
+        Returns
+        -------
+        dict | None
+            Row as a dict, or None if unknown
+        """
+        row = self._conn.execute(
+            "SELECT * FROM batch_jobs WHERE job_id = ?",
+            (job_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def list_pending_batch_jobs(self) -> list[dict]:
+        """
+        List batch jobs that have not been collected yet.
+
+        Returns
+        -------
+        list[dict]
+            Pending job rows, oldest first
+        """
+        cursor = self._conn.execute(
+            "SELECT * FROM batch_jobs WHERE status = 'pending' ORDER BY created_at"
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def mark_batch_collected(self, job_id: str) -> None:
+        """
+        Mark a batch job's results as collected.
+
+        Parameters
+        ----------
+        job_id : str
+            Provider-assigned batch job id
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE batch_jobs SET status = 'collected' WHERE job_id = ?",
+                (job_id,)
             )
-            return cursor.fetchone() is not None
+            self._conn.commit()
+
+    def get_feed_meta(self, feed_url: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        Get stored HTTP cache validators for a feed.
+
+        Parameters
+        ----------
+        feed_url : str
+            URL of the RSS feed
+
+        Returns
+        -------
+        tuple[str | None, str | None]
+            (etag, modified) from the last successful fetch, or (None, None)
+        """
+        row = self._conn.execute(
+            "SELECT etag, modified FROM feed_meta WHERE feed_url = ?",
+            (feed_url,)
+        ).fetchone()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def set_feed_meta(self, feed_url: str, etag: Optional[str], modified: Optional[str]) -> None:
+        """
+        Store HTTP cache validators for a feed.
+
+        Parameters
+        ----------
+        feed_url : str
+            URL of the RSS feed
+        etag : str, optional
+            ETag header from the last response
+        modified : str, optional
+            Last-Modified header from the last response
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO feed_meta (feed_url, etag, modified, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (feed_url, etag, modified, datetime.now())
+            )
+            self._conn.commit()
+
+    def filter_unprocessed(self, urls: list[str]) -> list[str]:
+        """
+        Filter a list of paper URLs down to those not yet processed.
+
+        One IN query per 500 URLs replaces a SELECT round-trip per paper.
+
+        Parameters
+        ----------
+        urls : list[str]
+            Candidate paper URLs
+
+        Returns
+        -------
+        list[str]
+            URLs with no row in the papers table, in input order
+        """
+        known: set[str] = set()
+        # Chunk to stay under SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT paper_url FROM papers WHERE paper_url IN ({placeholders})",
+                chunk,
+            )
+            known.update(row[0] for row in cursor)
+        return [u for u in urls if u not in known]
 
     def mark_processed(
         self,
@@ -119,8 +348,8 @@ class PaperDatabase:
         method_match : bool
             Whether method matches interests
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 INSERT OR REPLACE INTO papers
                 (feed_url, paper_url, title, authors, source, feed_group, is_relevant, field_match, method_match, summary, processed_at)
@@ -128,7 +357,34 @@ class PaperDatabase:
                 """,
                 (feed_url, paper_url, title, authors, source, feed_group, is_relevant, field_match, method_match, summary, datetime.now())
             )
-            conn.commit()
+            self._conn.commit()
+
+    def mark_processed_batch(self, rows: list[tuple]) -> None:
+        """
+        Mark multiple papers as processed in a single transaction.
+
+        One executemany inside one commit replaces N connections and N
+        fsyncs when marking a whole run's worth of papers.
+
+        Parameters
+        ----------
+        rows : list[tuple]
+            Tuples of (feed_url, paper_url, title, authors, source,
+            feed_group, is_relevant, field_match, method_match, summary)
+        """
+        if not rows:
+            return
+        now = datetime.now()
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO papers
+                (feed_url, paper_url, title, authors, source, feed_group, is_relevant, field_match, method_match, summary, processed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [row + (now,) for row in rows],
+            )
+            self._conn.commit()
 
     def get_recent_relevant(self, days: int = 7) -> list[dict]:
         """
@@ -144,18 +400,16 @@ class PaperDatabase:
         list[dict]
             List of relevant papers
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT * FROM papers
-                WHERE is_relevant = TRUE
-                AND processed_at >= datetime('now', ?)
-                ORDER BY processed_at DESC
-                """,
-                (f'-{days} days',)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._conn.execute(
+            """
+            SELECT * FROM papers
+            WHERE is_relevant = TRUE
+            AND processed_at >= datetime('now', ?)
+            ORDER BY processed_at DESC
+            """,
+            (f'-{days} days',)
+        )
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_stats(self, days: int | None = None) -> dict:
         """
@@ -171,41 +425,38 @@ class PaperDatabase:
         dict
             Statistics including total papers, relevant papers, date range, etc.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            if days:
-                where_clause = f"WHERE processed_at >= datetime('now', '-{days} days')"
-            else:
-                where_clause = ""
-
-            total = conn.execute(f"SELECT COUNT(*) FROM papers {where_clause}").fetchone()[0]
-            relevant = conn.execute(
-                f"SELECT COUNT(*) FROM papers {where_clause} {'AND' if where_clause else 'WHERE'} is_relevant = TRUE"
-            ).fetchone()[0]
-
-            # Get date range
-            date_from = conn.execute(
-                f"SELECT MIN(processed_at) FROM papers {where_clause}"
-            ).fetchone()[0]
-            date_to = conn.execute(
-                f"SELECT MAX(processed_at) FROM papers {where_clause}"
-            ).fetchone()[0]
-
-            # Get unique feeds
-            num_feeds = conn.execute(
-                f"SELECT COUNT(DISTINCT feed_url) FROM papers {where_clause}"
-            ).fetchone()[0]
-
-            # Format dates
-            if date_from:
-                date_from = date_from.split()[0] if ' ' in date_from else date_from[:10]
-            if date_to:
-                date_to = date_to.split()[0] if ' ' in date_to else date_to[:10]
-
-            return {
-                "total_papers": total,
-                "relevant_papers": relevant,
-                "irrelevant_papers": total - relevant,
-                "num_feeds": num_feeds,
-                "date_from": date_from,
-                "date_to": date_to,
-            }
+        # One scan with conditional aggregates instead of five separate
+        # SELECTs; days is bound as a parameter rather than interpolated.
+        if days:
+            where_clause = "WHERE processed_at >= datetime('now', ?)"
+            params = (f'-{days} days',)
+        else:
+            where_clause = ""
+            params = ()
+
+        total, relevant, date_from, date_to, num_feeds = self._conn.execute(
+            f"""
+            SELECT COUNT(*),
+                   COALESCE(SUM(CASE WHEN is_relevant THEN 1 ELSE 0 END), 0),
+                   MIN(processed_at),
+                   MAX(processed_at),
+                   COUNT(DISTINCT feed_url)
+            FROM papers {where_clause}
+            """,
+            params,
+        ).fetchone()
+
+        # Format dates
+        if date_from:
+            date_from = date_from.split()[0] if ' ' in date_from else date_from[:10]
+        if date_to:
+            date_to = date_to.split()[0] if ' ' in date_to else date_to[:10]
+
+        return {
+            "total_papers": total,
+            "relevant_papers": relevant,
+            "irrelevant_papers": total - relevant,
+            "num_feeds": num_feeds,
+            "date_from": date_from,
+            "date_to": date_to,
+        }
@@ -3,6 +3,7 @@
 import logging
 import smtplib
 from datetime import datetime
+from html import escape
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any
@@ -10,6 +11,41 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+class SmtpSession:
+    """
+    Reusable SMTP connection for sending multiple emails.
+
+    Opens the connection (with STARTTLS + login) once on entry and keeps it
+    alive across sends, avoiding a TLS handshake and AUTH round-trip per
+    message. Pass an open session to send_email / send_test_email to reuse
+    it; without one they fall back to a per-call connection.
+    """
+
+    def __init__(self, smtp_server: str, smtp_port: int, username: str, password: str):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> "SmtpSession":
+        self.server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        self.server.starttls()
+        self.server.login(self.username, self.password)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.server.quit()
+        except Exception:
+            pass
+        self.server = None
+
+    def send(self, recipient: str, msg: MIMEMultipart) -> None:
+        """Send a prepared message over the open connection."""
+        self.server.sendmail(self.username, recipient, msg.as_string())
+
+
 def format_paper_plain(papers: list[dict[str, Any]], stats: dict[str, Any] | None = None) -> str:
     """Format papers as plain text."""
     if not papers:
@@ -42,6 +78,21 @@ def format_paper_plain(papers: list[dict[str, Any]], stats: dict[str, Any] | Non
     return "\n".join(lines)
 
 
+# Per-paper HTML rendered with a single format call per paper; the optional
+# authors/relevance rows are substituted in as pre-rendered blocks (or empty).
+_PAPER_HTML_TEMPLATE = (
+    '<div style="margin-bottom: 20px; padding: 12px; border-left: 3px solid #1a73e8; background: #f8f9fa;">\n'
+    '<p style="margin: 0 0 8px 0;"><b style="font-size: 15px;">{index}. {title}</b></p>\n'
+    '<p style="margin: 4px 0;"><b>Source:</b> {source}</p>'
+    '{authors_block}\n'
+    '<p style="margin: 4px 0;"><b>Link:</b> <a href="{link}" style="color: #1a73e8;">{link}</a></p>'
+    '{summary_block}\n'
+    '</div>'
+)
+_AUTHORS_BLOCK = '\n<p style="margin: 4px 0;"><b>Authors:</b> {authors}</p>'
+_SUMMARY_BLOCK = '\n<p style="margin: 4px 0;"><b>Relevance:</b> {summary}</p>'
+
+
 def format_paper_html(papers: list[dict[str, Any]], stats: dict[str, Any] | None = None) -> str:
     """Format papers as Gmail-friendly HTML."""
     if not papers:
@@ -62,21 +113,18 @@ def format_paper_html(papers: list[dict[str, Any]], stats: dict[str, Any] | None
     html.append('<h2 style="color: #1a73e8;">Relevant Papers</h2>')
 
     for i, paper in enumerate(papers, 1):
-        html.append('<div style="margin-bottom: 20px; padding: 12px; border-left: 3px solid #1a73e8; background: #f8f9fa;">')
-        # Bold title
-        html.append(f'<p style="margin: 0 0 8px 0;"><b style="font-size: 15px;">{i}. {paper["title"]}</b></p>')
-        # Source
-        html.append(f'<p style="margin: 4px 0;"><b>Source:</b> {paper.get("source", "Unknown")}</p>')
-        # Authors (only if available)
-        if paper.get('authors') and paper.get('authors') != 'Unknown':
-            html.append(f'<p style="margin: 4px 0;"><b>Authors:</b> {paper.get("authors")}</p>')
-        # Link
-        link = paper.get('link', '#')
-        html.append(f'<p style="margin: 4px 0;"><b>Link:</b> <a href="{link}" style="color: #1a73e8;">{link}</a></p>')
-        # Relevance
-        if paper.get('summary'):
-            html.append(f'<p style="margin: 4px 0;"><b>Relevance:</b> {paper["summary"]}</p>')
-        html.append('</div>')
+        authors = paper.get('authors')
+        summary = paper.get('summary')
+        # Escape once at format time; feed titles/abstracts regularly carry
+        # HTML fragments that would otherwise break the markup
+        html.append(_PAPER_HTML_TEMPLATE.format(
+            index=i,
+            title=escape(paper["title"]),
+            source=escape(paper.get("source", "Unknown")),
+            authors_block=_AUTHORS_BLOCK.format(authors=escape(authors)) if authors and authors != 'Unknown' else '',
+            link=escape(paper.get('link', '#'), quote=True),
+            summary_block=_SUMMARY_BLOCK.format(summary=escape(summary)) if summary else '',
+        ))
 
     html.append('</div>')
     return '\n'.join(html)
@@ -91,6 +139,7 @@ def send_email(
     papers: list[dict[str, Any]],
     sender_name: str = "agent-rss",
     stats: dict[str, Any] | None = None,
+    session: SmtpSession | None = None,
 ) -> bool:
     """
     Send email notification with paper summaries.
@@ -113,6 +162,8 @@ def send_email(
         Sender display name
     stats : dict, optional
         Summary statistics (num_feeds, total_screened, date_from, date_to)
+    session : SmtpSession, optional
+        Open SMTP session to reuse; a fresh connection is made if omitted
 
     Returns
     -------
@@ -136,10 +187,11 @@ def send_email(
     msg.attach(MIMEText(f"<html><body>{html_body}</body></html>", 'html'))
 
     try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(username, password)
-            server.sendmail(username, recipient, msg.as_string())
+        if session is not None:
+            session.send(recipient, msg)
+        else:
+            with SmtpSession(smtp_server, smtp_port, username, password) as one_shot:
+                one_shot.send(recipient, msg)
         logger.info(f"Email sent successfully to {recipient}")
         return True
     except Exception as e:
@@ -154,6 +206,7 @@ def send_test_email(
     password: str,
     recipient: str,
     sender_name: str = "agent-rss",
+    session: SmtpSession | None = None,
 ) -> bool:
     """
     Send a test email to verify configuration.
@@ -172,6 +225,8 @@ def send_test_email(
         Recipient email address
     sender_name : str
         Sender display name
+    session : SmtpSession, optional
+        Open SMTP session to reuse; a fresh connection is made if omitted
 
     Returns
     -------
@@ -194,4 +249,5 @@ def send_test_email(
         recipient=recipient,
         papers=test_papers,
         sender_name=sender_name,
+        session=session,
     )
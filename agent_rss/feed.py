@@ -1,16 +1,28 @@
 """RSS feed fetching and parsing."""
 
+import dataclasses
 import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 import feedparser
 
+from .db import PaperDatabase
+
 logger = logging.getLogger(__name__)
 
+# feedparser exposes no per-request timeout; cap the socket-level default so
+# one stuck feed can't block a fetch worker indefinitely.
+FETCH_TIMEOUT = 30  # seconds
+
+# Upper bound on concurrent feed fetches
+MAX_FETCH_WORKERS = 32
+
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Represents an academic paper from an RSS feed."""
 
@@ -25,92 +37,114 @@ class Paper:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "link": self.link,
-            "authors": self.authors,
-            "abstract": self.abstract,
-            "published": self.published.isoformat() if self.published else None,
-            "source": self.source,
-            "feed_url": self.feed_url,
-        }
+        d = {name: getattr(self, name) for name in _PAPER_FIELDS}
+        d['published'] = d['published'].isoformat() if d['published'] else None
+        return d
+
+
+# Cached once so to_dict doesn't re-enumerate dataclass fields per paper
+_PAPER_FIELDS = tuple(f.name for f in dataclasses.fields(Paper))
 
 
 def parse_date(entry: dict) -> Optional[datetime]:
     """Parse publication date from feed entry."""
-    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-        try:
-            return datetime(*entry.published_parsed[:6])
-        except (TypeError, ValueError):
-            pass
-    if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-        try:
-            return datetime(*entry.updated_parsed[:6])
-        except (TypeError, ValueError):
-            pass
+    # FeedParserDict supports .get(), which is one lookup per field instead
+    # of the hasattr + attribute-access double probe.
+    for parsed in (entry.get('published_parsed'), entry.get('updated_parsed')):
+        if parsed:
+            try:
+                return datetime(*parsed[:6])
+            except (TypeError, ValueError):
+                pass
     return None
 
 
 def extract_authors(entry: dict) -> str:
     """Extract authors from feed entry."""
     # Try different author fields
-    if hasattr(entry, 'authors') and entry.authors:
-        names = [a.get('name', '') for a in entry.authors if a.get('name')]
+    authors = entry.get('authors')
+    if authors:
+        names = ', '.join(a.get('name', '') for a in authors if a.get('name'))
         if names:
-            return ', '.join(names)
-    if hasattr(entry, 'author') and entry.author:
-        return entry.author
-    if hasattr(entry, 'author_detail') and entry.author_detail:
-        return entry.author_detail.get('name', 'Unknown')
+            return names
+    author = entry.get('author')
+    if author:
+        return author
+    author_detail = entry.get('author_detail')
+    if author_detail:
+        return author_detail.get('name', 'Unknown')
     return 'Unknown'
 
 
 def extract_abstract(entry: dict) -> str:
     """Extract abstract/summary from feed entry."""
-    # Try summary first
-    if hasattr(entry, 'summary') and entry.summary:
-        return entry.summary
-    # Try description
-    if hasattr(entry, 'description') and entry.description:
-        return entry.description
-    # Try content
-    if hasattr(entry, 'content') and entry.content:
-        for content in entry.content:
-            if content.get('value'):
-                return content['value']
+    # Try summary, then description, then content values
+    abstract = entry.get('summary') or entry.get('description')
+    if abstract:
+        return abstract
+    for content in entry.get('content') or ():
+        if content.get('value'):
+            return content['value']
     return ''
 
 
-def fetch_feed(feed_url: str) -> list[Paper]:
+def fetch_feed(feed_url: str, db: Optional[PaperDatabase] = None) -> list[Paper]:
     """
     Fetch and parse an RSS feed.
 
+    When a database is provided, the ETag/Last-Modified validators from the
+    previous fetch are sent as a conditional GET; an unchanged feed answers
+    304 with no body, skipping the download and parse entirely.
+
     Parameters
     ----------
     feed_url : str
         URL of the RSS feed
+    db : PaperDatabase, optional
+        Database for persisting HTTP cache validators between runs
 
     Returns
     -------
     list[Paper]
-        List of papers from the feed
+        List of papers from the feed (empty if the feed is unchanged)
     """
     logger.info(f"Fetching feed: {feed_url}")
 
+    etag, modified = db.get_feed_meta(feed_url) if db else (None, None)
+
     try:
-        feed = feedparser.parse(feed_url)
+        feed = feedparser.parse(feed_url, etag=etag, modified=modified)
     except Exception as e:
         logger.error(f"Failed to fetch feed {feed_url}: {e}")
         return []
 
+    if getattr(feed, 'status', None) == 304:
+        logger.info(f"Feed unchanged (304): {feed_url}")
+        return []
+
+    if db:
+        new_etag = feed.get('etag')
+        new_modified = feed.get('modified')
+        if new_etag or new_modified:
+            db.set_feed_meta(feed_url, new_etag, new_modified)
+
     if feed.bozo and feed.bozo_exception:
         logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
 
     # Get feed title as source
     source = feed.feed.get('title', 'Unknown Source') if hasattr(feed, 'feed') else 'Unknown Source'
 
+    # In steady state most entries are already in the DB; checking links up
+    # front skips author/abstract/date extraction for all of them.
+    new_links = None
+    if db:
+        links = [entry.get('link', '') for entry in feed.entries]
+        new_links = set(db.filter_unprocessed(links))
+
     papers = []
     for entry in feed.entries:
+        if new_links is not None and entry.get('link', '') not in new_links:
+            continue
         try:
             paper = Paper(
                 title=entry.get('title', 'No Title'),
@@ -130,7 +164,7 @@ def fetch_feed(feed_url: str) -> list[Paper]:
     return papers
 
 
-def fetch_all_feeds(feed_urls: list[str]) -> list[Paper]:
+def fetch_all_feeds(feed_urls: list[str], db: Optional[PaperDatabase] = None) -> list[Paper]:
     """
     Fetch papers from multiple RSS feeds.
 
@@ -138,14 +172,21 @@ def fetch_all_feeds(feed_urls: list[str]) -> list[Paper]:
     ----------
     feed_urls : list[str]
         List of RSS feed URLs
+    db : PaperDatabase, optional
+        Database for conditional-GET cache validators (see fetch_feed)
 
     Returns
     -------
     list[Paper]
         Combined list of papers from all feeds
     """
-    all_papers = []
-    for url in feed_urls:
-        papers = fetch_feed(url)
-        all_papers.extend(papers)
-    return all_papers
+    if not feed_urls:
+        return []
+
+    # Fetching is pure network wait; threads release the GIL on socket reads,
+    # so wall time drops from N*T to roughly T for N feeds.
+    socket.setdefaulttimeout(FETCH_TIMEOUT)
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(feed_urls))) as executor:
+        results = list(executor.map(lambda url: fetch_feed(url, db=db), feed_urls))
+
+    return [paper for papers in results for paper in papers]
@@ -1,9 +1,6 @@
 """LLM provider implementations for paper screening."""
 
 from .base import BaseLLM
-from .claude import ClaudeLLM
-from .openai import OpenAILLM
-from .gemini import GeminiLLM
 
 
 def get_llm(provider: str, api_key: str, model: str | None = None) -> BaseLLM:
@@ -24,16 +21,19 @@ def get_llm(provider: str, api_key: str, model: str | None = None) -> BaseLLM:
     BaseLLM
         LLM instance
     """
-    providers = {
-        "claude": ClaudeLLM,
-        "openai": OpenAILLM,
-        "gemini": GeminiLLM,
-    }
-    if provider not in providers:
-        raise ValueError(f"Unknown provider: {provider}. Choose from: {list(providers.keys())}")
+    # Providers are imported lazily so only the selected SDK is loaded;
+    # the unused SDKs each cost hundreds of ms of import time
+    if provider == "claude":
+        from .claude import ClaudeLLM as llm_class
+    elif provider == "openai":
+        from .openai import OpenAILLM as llm_class
+    elif provider == "gemini":
+        from .gemini import GeminiLLM as llm_class
+    else:
+        raise ValueError(f"Unknown provider: {provider}. Choose from: ['claude', 'openai', 'gemini']")
     if model:
-        return providers[provider](api_key, model=model)
-    return providers[provider](api_key)
+        return llm_class(api_key, model=model)
+    return llm_class(api_key)
 
 
-__all__ = ["BaseLLM", "ClaudeLLM", "OpenAILLM", "GeminiLLM", "get_llm"]
+__all__ = ["BaseLLM", "get_llm"]
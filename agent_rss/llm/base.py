@@ -1,9 +1,96 @@
 """Base class for LLM providers."""
 
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Retry policy for rate limits and transient server errors
+_MAX_ATTEMPTS = 6
+_BACKOFF_MAX = 60.0
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504, 529})
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Check for a rate limit or transient server error from any provider SDK."""
+    # anthropic/openai expose status_code on the exception; google-genai
+    # uses code; httpx transport errors carry a response
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _RETRYABLE_STATUS
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Honor the server's Retry-After; else exponential backoff with full jitter."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    retry_after = headers.get("retry-after") if headers else None
+    if retry_after:
+        try:
+            return min(float(retry_after), _BACKOFF_MAX)
+        except ValueError:
+            pass
+    # Full jitter spreads concurrent retries so they don't re-stampede
+    # the limit in lockstep
+    return random.uniform(1.0, min(_BACKOFF_MAX, 2.0 ** attempt))
+
+# Matches the three response fields in one pass; DOTALL lets the summary
+# capture run to the end of the response (it may span lines)
+_RESPONSE_RE = re.compile(
+    r"FIELD_MATCH:\s*(\S+).*?METHOD_MATCH:\s*(\S+).*?SUMMARY:\s*(.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+_YES_VALUES = frozenset({'yes', 'true', '1'})
+
+# Some feeds embed HTML in abstracts; strip it before prompt build
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Variable prompt content is capped so one verbose feed can't inflate
+# input tokens; normalized text also makes near-duplicate papers hash
+# and embed identically for the caches
+_MAX_TITLE_CHARS = 300
+_MAX_ABSTRACT_CHARS = 1500
+
+
+def _normalize(text: str) -> str:
+    """Strip HTML tags and collapse runs of whitespace."""
+    if not text:
+        return ""
+    return _WS_RE.sub(" ", _TAG_RE.sub(" ", text)).strip()
+
+# JSON schema for structured screening output; providers translate this
+# into their native structured-output mechanism (tool call, json_schema,
+# response_schema) so responses parse with one json.loads instead of regex
+RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "field_match": {
+            "type": "boolean",
+            "description": "Whether the research field matches the interests",
+        },
+        "method_match": {
+            "type": "boolean",
+            "description": "Whether the methods match the interests",
+        },
+        "summary": {
+            "type": "string",
+            "description": "Structured summary, or 'Not related' if neither matches",
+        },
+    },
+    "required": ["field_match", "method_match", "summary"],
+    "additionalProperties": False,
+}
+
 
 @dataclass
 class ScreeningResult:
@@ -19,17 +106,15 @@ class ScreeningResult:
 class BaseLLM(ABC):
     """Abstract base class for LLM providers."""
 
-    SCREENING_PROMPT = """You are an academic paper screening assistant. Determine if a paper is relevant to the researcher's interests.
+    # The prompt is split so everything that is constant across one run
+    # (interests, instructions, examples) forms a system prefix, and only
+    # the tiny per-paper block varies. Provider-side prompt caching then
+    # covers the prefix: one cache entry serves every paper in the run.
+    SYSTEM_TEMPLATE = """You are an academic paper screening assistant. Determine if a paper is relevant to the researcher's interests.
 
 ## Research Interests
 {interests}
 {examples_section}
-## Paper Information
-- **Title**: {title}
-- **Authors**: {authors}
-- **Abstract**: {abstract}
-- **Source**: {source}
-
 ## Instructions
 1. Determine if the research FIELD matches the interests (genomics, biology, bioinformatics, etc.)
 2. Determine if the METHOD matches the interests (deep learning, machine learning, AI, etc.)
@@ -40,8 +125,14 @@ class BaseLLM(ABC):
    - Highlights: [other key points, comma-separated]
 4. If no abstract (title only), just list keywords
 5. Learn from user's liked/disliked examples if provided - they show specific preferences
+"""
 
-## Response Format
+    # Labeled text format, appended only for batch prompts: batch
+    # submissions don't use structured output, so the model needs the
+    # response format spelled out. The interactive path forces
+    # RESULT_SCHEMA instead and must not instruct a format the model is
+    # forbidden from producing.
+    TEXT_FORMAT_SECTION = """## Response Format
 FIELD_MATCH: [yes/no]
 METHOD_MATCH: [yes/no]
 SUMMARY: [structured summary or keywords, or "Not related" if neither matches]
@@ -67,19 +158,163 @@ METHOD_MATCH: no
 SUMMARY: Not related
 """
 
+
     def __init__(self, api_key: str):
         """Initialize with API key."""
         self.api_key = api_key
+        self.semantic_cache = None
+        self.prompt_cache = None
+        # Memoized examples sections; examples are loaded once per run, so
+        # keying on object identity avoids rebuilding the same string per paper
+        self._examples_cache: dict[int, str] = {}
+        # System prefix pre-rendered by prepare(); None until then
+        self._system_prefix: Optional[str] = None
+
+    def prepare(self, interests: str, examples: dict | None = None) -> None:
+        """
+        Pre-render the static system prefix for a run.
+
+        The prefix (interests + instructions + examples) is invariant
+        within a run; rendering it once here means screening calls only
+        format the small per-paper block. Callers must pass the same
+        interests/examples to the subsequent screen_paper calls.
+
+        Parameters
+        ----------
+        interests : str
+            Research interests to match against
+        examples : dict | None
+            Optional dict with "liked" and "disliked" paper examples
+        """
+        self._system_prefix = self.SYSTEM_TEMPLATE.format(
+            interests=interests,
+            examples_section=self._format_examples_section(examples),
+        )
+
+    def enable_semantic_cache(
+        self,
+        db_path: str = "~/.agent-rss/semcache.db",
+        threshold: float = 0.95,
+    ) -> None:
+        """
+        Enable caching of screening verdicts by paper-text similarity.
+
+        Near-duplicate papers (overlapping feeds, preprint revisions) then
+        resolve locally instead of repeating the API call.
+
+        Parameters
+        ----------
+        db_path : str
+            Path to the cache database file
+        threshold : float
+            Minimum cosine similarity for a hit
+        """
+        from .cache import SemanticCache
+        self.semantic_cache = SemanticCache(db_path, threshold=threshold)
+
+    def enable_prompt_cache(self, db) -> None:
+        """
+        Enable exact-match caching of responses keyed by prompt digest.
+
+        Cheaper than the semantic cache (one hash, no vector scan) and
+        exact: reruns after a crash or the same link in two feed groups
+        produce byte-identical prompts. Acts as an L1 in front of the
+        semantic cache.
+
+        Parameters
+        ----------
+        db : PaperDatabase
+            Database providing get_cached_response / cache_response
+        """
+        self.prompt_cache = db
+
+    def _call_with_retry(self, prompt: str, system: Optional[str] = None) -> str:
+        """Call the API, retrying rate limits and transient server errors."""
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return self._call_api(prompt, system)
+            except Exception as e:
+                if attempt == _MAX_ATTEMPTS or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"Retryable API error (attempt {attempt}/{_MAX_ATTEMPTS}), "
+                    f"waiting {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
+    async def _call_with_retry_async(self, prompt: str, system: Optional[str] = None) -> str:
+        """Async variant of _call_with_retry."""
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return await self._call_api_async(prompt, system)
+            except Exception as e:
+                if attempt == _MAX_ATTEMPTS or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"Retryable API error (attempt {attempt}/{_MAX_ATTEMPTS}), "
+                    f"waiting {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    def _cached_call(self, prompt: str, system: Optional[str] = None) -> str:
+        """Call the API through the exact-hash prompt cache."""
+        key = hashlib.blake2b(f"{system or ''}\x00{prompt}".encode(), digest_size=16).hexdigest()
+        response = self.prompt_cache.get_cached_response(key)
+        if response is None:
+            response = self._call_with_retry(prompt, system)
+            self.prompt_cache.cache_response(key, response)
+        return response
+
+    async def _cached_call_async(self, prompt: str, system: Optional[str] = None) -> str:
+        """Async variant of _cached_call."""
+        key = hashlib.blake2b(f"{system or ''}\x00{prompt}".encode(), digest_size=16).hexdigest()
+        response = self.prompt_cache.get_cached_response(key)
+        if response is None:
+            response = await self._call_with_retry_async(prompt, system)
+            self.prompt_cache.cache_response(key, response)
+        return response
+
+    @staticmethod
+    def _http_pool_args() -> dict:
+        """
+        Shared httpx pool settings passed to the SDK clients.
+
+        The keep-alive pool is sized for the concurrent screening pool so
+        the TCP+TLS handshake is paid once per connection, not per
+        request, and idle connections survive between bursts.
+        """
+        import httpx
+        return {
+            "limits": httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+            "timeout": httpx.Timeout(60.0),
+        }
+
+    @staticmethod
+    def _cache_context_key(interests: str, examples: dict | None) -> str:
+        """Hash the screening context so edits to interests/examples invalidate the cache."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(interests.encode())
+        h.update(repr(examples).encode())
+        return h.hexdigest()
 
     @abstractmethod
-    def _call_api(self, prompt: str) -> str:
+    def _call_api(self, prompt: str, system: Optional[str] = None) -> str:
         """
         Call the LLM API with a prompt.
 
         Parameters
         ----------
         prompt : str
-            The prompt to send to the LLM
+            The per-paper prompt to send to the LLM
+        system : str, optional
+            Static system prefix, identical across a run; providers mark
+            it for prompt caching where the API supports that
 
         Returns
         -------
@@ -88,15 +323,79 @@ SUMMARY: Not related
         """
         pass
 
+    async def _call_api_async(self, prompt: str, system: Optional[str] = None) -> str:
+        """
+        Async variant of _call_api.
+
+        Providers with a native async client override this; the default
+        runs the synchronous call in a worker thread so concurrency still
+        works for any provider.
+
+        Parameters
+        ----------
+        prompt : str
+            The per-paper prompt to send to the LLM
+        system : str, optional
+            Static system prefix, identical across a run
+
+        Returns
+        -------
+        str
+            The LLM's response
+        """
+        return await asyncio.to_thread(self._call_api, prompt, system)
+
+    def submit_batch(self, prompts: list[tuple[str, str]]) -> str:
+        """
+        Submit prompts as one provider batch job.
+
+        Batch endpoints trade latency (results within 24h) for half the
+        per-token cost, which suits non-interactive cron runs.
+
+        Parameters
+        ----------
+        prompts : list[tuple[str, str]]
+            (custom_id, prompt) pairs
+
+        Returns
+        -------
+        str
+            Provider-assigned job id
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch submission")
+
+    def fetch_batch(self, job_id: str) -> Optional[dict[str, str]]:
+        """
+        Fetch results of a previously submitted batch job.
+
+        Parameters
+        ----------
+        job_id : str
+            Provider-assigned job id
+
+        Returns
+        -------
+        dict[str, str] | None
+            Mapping of custom_id to response text for completed requests,
+            or None if the job is still processing
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch fetching")
+
     def _format_examples_section(self, examples: dict | None) -> str:
         """Format examples into prompt section."""
         if not examples:
             return ""
 
+        key = id(examples)
+        cached = self._examples_cache.get(key)
+        if cached is not None:
+            return cached
+
         liked = examples.get("liked", [])
         disliked = examples.get("disliked", [])
 
         if not liked and not disliked:
+            self._examples_cache[key] = ""
             return ""
 
         sections = []
@@ -119,7 +418,9 @@ SUMMARY: Not related
                     parts.append(f"  Reason: {ex['reason']}")
                 sections.append(f"{i}. " + "\n   ".join(parts))
 
-        return "\n".join(sections) + "\n"
+        section = "\n".join(sections) + "\n"
+        self._examples_cache[key] = section
+        return section
 
     def screen_paper(
         self,
@@ -153,48 +454,142 @@ SUMMARY: Not related
         ScreeningResult
             Screening result with relevance and summary
         """
-        examples_section = self._format_examples_section(examples)
+        title = _normalize(title)[:_MAX_TITLE_CHARS]
+        abstract = _normalize(abstract)[:_MAX_ABSTRACT_CHARS]
+        cache_text = f"{title} {abstract[:500]}"
+        context_key = None
+        if self.semantic_cache:
+            context_key = self._cache_context_key(interests, examples)
+            cached = self.semantic_cache.get(cache_text, context_key)
+            if cached:
+                return cached
+
+        system, prompt = self._build_messages(title, authors, abstract, source, interests, examples)
+        if self.prompt_cache:
+            response = self._cached_call(prompt, system)
+        else:
+            response = self._call_with_retry(prompt, system)
+        result = self._parse_response_json(response)
+
+        if self.semantic_cache:
+            self.semantic_cache.put(cache_text, context_key, result)
+        return result
+
+    async def screen_paper_async(
+        self,
+        title: str,
+        authors: str,
+        abstract: str,
+        source: str,
+        interests: str,
+        examples: dict | None = None,
+    ) -> ScreeningResult:
+        """
+        Screen a paper asynchronously.
 
-        prompt = self.SCREENING_PROMPT.format(
-            interests=interests,
-            examples_section=examples_section,
-            title=title,
-            authors=authors,
-            abstract=abstract,
-            source=source,
+        Same contract as screen_paper; used by the CLI to screen many
+        papers concurrently under a bounded pool.
+        """
+        title = _normalize(title)[:_MAX_TITLE_CHARS]
+        abstract = _normalize(abstract)[:_MAX_ABSTRACT_CHARS]
+        cache_text = f"{title} {abstract[:500]}"
+        context_key = None
+        if self.semantic_cache:
+            context_key = self._cache_context_key(interests, examples)
+            cached = self.semantic_cache.get(cache_text, context_key)
+            if cached:
+                return cached
+
+        system, prompt = self._build_messages(title, authors, abstract, source, interests, examples)
+        if self.prompt_cache:
+            response = await self._cached_call_async(prompt, system)
+        else:
+            response = await self._call_with_retry_async(prompt, system)
+        result = self._parse_response_json(response)
+
+        if self.semantic_cache:
+            self.semantic_cache.put(cache_text, context_key, result)
+        return result
+
+    def _build_messages(
+        self,
+        title: str,
+        authors: str,
+        abstract: str,
+        source: str,
+        interests: str,
+        examples: dict | None,
+    ) -> tuple[str, str]:
+        """Render the (system prefix, per-paper prompt) pair for one paper."""
+        # Re-normalizing here is cheap and keeps the batch path
+        # (build_prompt), which bypasses screen_paper, bounded too
+        title = _normalize(title)[:_MAX_TITLE_CHARS]
+        abstract = _normalize(abstract)[:_MAX_ABSTRACT_CHARS]
+        if self._system_prefix is not None:
+            system = self._system_prefix
+        else:
+            system = self.SYSTEM_TEMPLATE.format(
+                interests=interests,
+                examples_section=self._format_examples_section(examples),
+            )
+        # f-string interpolation: this is the only per-paper formatting work
+        prompt = (
+            "## Paper Information\n"
+            f"- **Title**: {title}\n"
+            f"- **Authors**: {authors}\n"
+            f"- **Abstract**: {abstract}\n"
+            f"- **Source**: {source}\n"
         )
+        return system, prompt
 
-        response = self._call_api(prompt)
-        return self._parse_response(response)
+    def build_prompt(
+        self,
+        title: str,
+        authors: str,
+        abstract: str,
+        source: str,
+        interests: str,
+        examples: dict | None,
+    ) -> str:
+        """Render the full screening prompt as one string (batch submission)."""
+        system, prompt = self._build_messages(title, authors, abstract, source, interests, examples)
+        return f"{system}\n{self.TEXT_FORMAT_SECTION}\n{prompt}"
 
-    def _parse_response(self, response: str) -> ScreeningResult:
+    def parse_response(self, response: str) -> ScreeningResult:
         """Parse LLM response into ScreeningResult."""
-        lines = response.strip().split('\n')
-
-        field_match = False
-        method_match = False
-        summary = ""
-
-        for line in lines:
-            line = line.strip()
-            if line.upper().startswith('FIELD_MATCH:'):
-                value = line.split(':', 1)[1].strip().lower()
-                field_match = value in ('yes', 'true', '1')
-            elif line.upper().startswith('METHOD_MATCH:'):
-                value = line.split(':', 1)[1].strip().lower()
-                method_match = value in ('yes', 'true', '1')
-            elif line.upper().startswith('SUMMARY:'):
-                summary = line.split(':', 1)[1].strip()
-
-        # If summary spans multiple lines, capture everything after SUMMARY:
-        if 'SUMMARY:' in response:
-            summary = response.split('SUMMARY:', 1)[1].strip()
+        m = _RESPONSE_RE.search(response)
+        if m:
+            field_match = m.group(1).lower() in _YES_VALUES
+            method_match = m.group(2).lower() in _YES_VALUES
+            summary = m.group(3).strip()
+        else:
+            # Malformed response; salvage a summary if one is present
+            field_match = False
+            method_match = False
+            summary = response.split('SUMMARY:', 1)[1].strip() if 'SUMMARY:' in response else ""
 
         # is_relevant = True if either field or method matches
-        is_relevant = field_match or method_match
+        return ScreeningResult(
+            is_relevant=field_match or method_match,
+            summary=summary,
+            field_match=field_match,
+            method_match=method_match,
+        )
+
+    def _parse_response_json(self, response: str) -> ScreeningResult:
+        """Parse a structured (RESULT_SCHEMA) JSON response into ScreeningResult."""
+        try:
+            data = json.loads(response)
+            field_match = bool(data["field_match"])
+            method_match = bool(data["method_match"])
+            summary = str(data.get("summary", "")).strip()
+        except (ValueError, KeyError, TypeError):
+            # Labeled-format response (batch results, entries cached
+            # before structured output); fall back to the regex parser
+            return self.parse_response(response)
 
         return ScreeningResult(
-            is_relevant=is_relevant,
+            is_relevant=field_match or method_match,
             summary=summary,
             field_match=field_match,
             method_match=method_match,
@@ -0,0 +1,174 @@
+"""Semantic cache for LLM screening responses."""
+
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from .base import ScreeningResult
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _embed(text: str) -> dict[str, float]:
+    """Embed text as a sparse unit vector of token frequencies."""
+    counts = Counter(_TOKEN_RE.findall(text.lower()))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    if not norm:
+        return {}
+    return {token: count / norm for token, count in counts.items()}
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    """Cosine similarity of two sparse unit vectors."""
+    if len(b) < len(a):
+        a, b = b, a
+    return sum(weight * b.get(token, 0.0) for token, weight in a.items())
+
+
+class SemanticCache:
+    """
+    Similarity-keyed cache of ScreeningResult objects.
+
+    The same paper frequently reappears across overlapping feeds and reruns,
+    often with near-identical text (preprint revisions, cross-listed
+    categories). Caching verdicts by text similarity turns those repeat
+    screenings into local lookups instead of API calls.
+
+    Entries are stored in SQLite as sparse token-frequency unit vectors and
+    matched by cosine similarity; this stays within the project's
+    no-heavy-dependency constraint while still catching near-duplicates.
+    Entries are partitioned by a context key (hash of the interests/examples
+    prompt context), so editing interests.md safely invalidates old verdicts.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "~/.agent-rss/semcache.db",
+        threshold: float = 0.95,
+        max_age_days: int = 30,
+    ):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        db_path : str | Path
+            Path to the cache database file
+        threshold : float
+            Minimum cosine similarity for a hit
+        max_age_days : int
+            Entries older than this are pruned at startup; duplicates
+            cluster within days of each other, so old entries only add
+            scan cost
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                context_key TEXT NOT NULL,
+                vector TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_context_key ON entries(context_key)")
+        # Prune at init so the table can't grow without bound; without
+        # this, lookups eventually scan months of stale vectors
+        pruned = self._conn.execute(
+            "DELETE FROM entries WHERE created_at < datetime('now', ?)",
+            (f"-{max_age_days} days",)
+        ).rowcount
+        if pruned > 0:
+            logger.debug(f"Pruned {pruned} semantic cache entries older than {max_age_days} days")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # Decoded (vector, result_json) pairs per context, loaded once
+        # per run so lookups don't JSON-decode every row per paper
+        self._mem: dict[str, list[tuple[dict[str, float], str]]] = {}
+
+    def get(self, text: str, context_key: str) -> Optional[ScreeningResult]:
+        """
+        Look up a cached verdict for similar text.
+
+        Parameters
+        ----------
+        text : str
+            Paper text (title + abstract) to match
+        context_key : str
+            Hash of the screening context (interests/examples)
+
+        Returns
+        -------
+        ScreeningResult | None
+            Stored result of the most similar entry at or above the
+            threshold, or None on miss
+        """
+        query = _embed(text)
+        if not query:
+            return None
+
+        best_score = 0.0
+        best_result = None
+        for vector, result_json in self._entries(context_key):
+            score = _cosine(query, vector)
+            if score > best_score:
+                best_score = score
+                best_result = result_json
+
+        if best_result is not None and best_score >= self.threshold:
+            logger.debug(f"Semantic cache hit (similarity {best_score:.3f})")
+            return ScreeningResult(**json.loads(best_result))
+        return None
+
+    def put(self, text: str, context_key: str, result: ScreeningResult) -> None:
+        """
+        Store a screening verdict.
+
+        Parameters
+        ----------
+        text : str
+            Paper text the verdict was computed for
+        context_key : str
+            Hash of the screening context (interests/examples)
+        result : ScreeningResult
+            Verdict to cache
+        """
+        vector = _embed(text)
+        if not vector:
+            return
+        result_json = json.dumps(result.__dict__)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO entries (context_key, vector, result) VALUES (?, ?, ?)",
+                (context_key, json.dumps(vector), result_json)
+            )
+            self._conn.commit()
+            # Keep the in-memory view current if this context is loaded;
+            # otherwise the next get() loads everything from the DB
+            if context_key in self._mem:
+                self._mem[context_key].append((vector, result_json))
+
+    def _entries(self, context_key: str) -> list[tuple[dict[str, float], str]]:
+        """Decoded (vector, result_json) pairs for a context, loaded once per run."""
+        with self._lock:
+            entries = self._mem.get(context_key)
+            if entries is None:
+                cursor = self._conn.execute(
+                    "SELECT vector, result FROM entries WHERE context_key = ?",
+                    (context_key,)
+                )
+                entries = [(json.loads(vector_json), result_json) for vector_json, result_json in cursor]
+                self._mem[context_key] = entries
+        return entries
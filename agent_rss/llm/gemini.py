@@ -2,12 +2,18 @@
 
 import logging
 
-from google import genai
-
-from .base import BaseLLM
+from .base import RESULT_SCHEMA, BaseLLM
 
 logger = logging.getLogger(__name__)
 
+# Structured output: the model returns RESULT_SCHEMA JSON directly,
+# saving the label/markdown output tokens of the text format
+_GENERATE_CONFIG = {
+    "max_output_tokens": 200,
+    "response_mime_type": "application/json",
+    "response_schema": RESULT_SCHEMA,
+}
+
 
 class GeminiLLM(BaseLLM):
     """Google Gemini LLM provider."""
@@ -23,16 +29,43 @@ class GeminiLLM(BaseLLM):
         model : str
             Model name to use
         """
+        # Imported here so the SDK only loads when this provider is used
+        from google import genai
+
         super().__init__(api_key)
         self.model_name = model
-        self.client = genai.Client(api_key=api_key)
+        # The genai SDK owns its httpx clients; client_args forwards the
+        # same pool settings the other providers use
+        pool_args = self._http_pool_args()
+        self.client = genai.Client(
+            api_key=api_key,
+            http_options={"client_args": pool_args, "async_client_args": pool_args},
+        )
 
-    def _call_api(self, prompt: str) -> str:
+    def _call_api(self, prompt: str, system: str | None = None) -> str:
         """Call Gemini API."""
         try:
+            # Leading with the static prefix keeps the request a shared
+            # prefix across papers, which Gemini's implicit caching reuses
+            contents = f"{system}\n{prompt}" if system else prompt
             response = self.client.models.generate_content(
                 model=self.model_name,
-                contents=prompt,
+                contents=contents,
+                config=_GENERATE_CONFIG,
+            )
+            return response.text
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise
+
+    async def _call_api_async(self, prompt: str, system: str | None = None) -> str:
+        """Call Gemini API asynchronously."""
+        try:
+            contents = f"{system}\n{prompt}" if system else prompt
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=_GENERATE_CONFIG,
             )
             return response.text
         except Exception as e:
@@ -1,13 +1,20 @@
 """OpenAI LLM provider."""
 
+import io
+import json
 import logging
 
-from openai import OpenAI
-
-from .base import BaseLLM
+from .base import RESULT_SCHEMA, BaseLLM
 
 logger = logging.getLogger(__name__)
 
+# Structured output: the model returns RESULT_SCHEMA JSON directly,
+# saving the label/markdown output tokens of the text format
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "screen", "strict": True, "schema": RESULT_SCHEMA},
+}
+
 
 class OpenAILLM(BaseLLM):
     """OpenAI LLM provider."""
@@ -23,19 +30,98 @@ class OpenAILLM(BaseLLM):
         model : str
             Model name to use
         """
+        # Imported here so the SDK only loads when this provider is used
+        import httpx
+        from openai import AsyncOpenAI, OpenAI
+
         super().__init__(api_key)
         self.model = model
-        self.client = OpenAI(api_key=api_key)
+        pool_args = self._http_pool_args()
+        self.client = OpenAI(api_key=api_key, http_client=httpx.Client(**pool_args))
+        self.async_client = AsyncOpenAI(api_key=api_key, http_client=httpx.AsyncClient(**pool_args))
+
+    @staticmethod
+    def _build_api_messages(prompt: str, system: str | None) -> list[dict]:
+        """Put the static prefix first so automatic prefix caching applies."""
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return messages
 
-    def _call_api(self, prompt: str) -> str:
+    def _call_api(self, prompt: str, system: str | None = None) -> str:
         """Call OpenAI API."""
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                max_tokens=500,
-                messages=[{"role": "user", "content": prompt}],
+                max_tokens=200,
+                messages=self._build_api_messages(prompt, system),
+                response_format=_RESPONSE_FORMAT,
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+
+    async def _call_api_async(self, prompt: str, system: str | None = None) -> str:
+        """Call OpenAI API asynchronously."""
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                max_tokens=200,
+                messages=self._build_api_messages(prompt, system),
+                response_format=_RESPONSE_FORMAT,
             )
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             raise
+
+    def submit_batch(self, prompts: list[tuple[str, str]]) -> str:
+        """Submit prompts via the Batch API (50% cost, <=24h)."""
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "max_tokens": 200,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
+            for custom_id, prompt in prompts
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", io.BytesIO("\n".join(lines).encode())),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} request(s)")
+        return batch.id
+
+    def fetch_batch(self, job_id: str) -> dict[str, str] | None:
+        """Fetch Batch API results; None while still processing."""
+        batch = self.client.batches.retrieve(job_id)
+        if batch.status != "completed":
+            if batch.status in ("failed", "expired", "cancelled"):
+                logger.error(f"OpenAI batch {job_id} ended with status {batch.status}")
+                return {}
+            return None
+        responses = {}
+        content = self.client.files.content(batch.output_file_id).text
+        for line in content.splitlines():
+            if not line:
+                continue
+            item = json.loads(line)
+            body = (item.get("response") or {}).get("body") or {}
+            choices = body.get("choices")
+            if choices:
+                responses[item["custom_id"]] = choices[0]["message"]["content"]
+            else:
+                logger.error(f"Batch request {item.get('custom_id')} returned no choices")
+        return responses
@@ -0,0 +1,73 @@
+"""Cheap keyword prefilter ahead of LLM screening."""
+
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9-]+")
+
+# Below this many keywords the filter is too blunt to be safe: a terse
+# interests.md yields a handful of tokens, and topically relevant papers
+# that merely use different vocabulary would be dropped unscreened.
+# Callers should only apply the filter when build_keyword_set returns at
+# least this many tokens.
+MIN_KEYWORDS = 10
+
+# Common English / boilerplate words that carry no topical signal
+_STOPWORDS = frozenset({
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was',
+    'were', 'has', 'have', 'had', 'been', 'being', 'can', 'could', 'will',
+    'would', 'should', 'may', 'might', 'must', 'not', 'but', 'all', 'any',
+    'its', 'our', 'their', 'these', 'those', 'such', 'than', 'then',
+    'into', 'onto', 'about', 'between', 'during', 'using', 'used', 'use',
+    'based', 'new', 'novel', 'also', 'both', 'each', 'other', 'more',
+    'most', 'some', 'related', 'including', 'etc', 'well', 'very', 'like',
+    'interest', 'interests', 'interested', 'research', 'papers', 'paper',
+    'topics', 'topic', 'methods', 'method', 'fields', 'field',
+})
+
+
+def build_keyword_set(interests: str) -> set[str]:
+    """
+    Extract topical keyword tokens from the interests text.
+
+    Parameters
+    ----------
+    interests : str
+        Contents of interests.md
+
+    Returns
+    -------
+    set[str]
+        Lowercased tokens with stopwords and short words removed
+    """
+    keywords = set()
+    for token in _TOKEN_RE.findall(interests.lower()):
+        # Index hyphenated terms under their parts too, so
+        # "deep-learning" in the interests matches "learning" in a title
+        for part in token.split('-'):
+            if len(part) > 2 and part not in _STOPWORDS:
+                keywords.add(part)
+    return keywords
+
+
+def matches_keywords(text: str, keywords: set[str]) -> bool:
+    """
+    Check whether any interest keyword appears in the text.
+
+    Parameters
+    ----------
+    text : str
+        Paper text (title + abstract)
+    keywords : set[str]
+        Keyword set from build_keyword_set
+
+    Returns
+    -------
+    bool
+        True if at least one keyword token occurs in the text
+    """
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in keywords:
+            return True
+        if '-' in token and any(part in keywords for part in token.split('-')):
+            return True
+    return False
@@ -1,7 +1,13 @@
 """CLI entry point for agent-rss."""
 
+import asyncio
+import functools
+import json
 import logging
+import os
+import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -10,8 +16,9 @@ import click
 from .config import load_config, load_interests, parse_examples, parse_rss_list, parse_rss_list_grouped
 from .db import PaperDatabase
 from .email_sender import send_email, send_test_email
-from .feed import fetch_feed
+from .feed import FETCH_TIMEOUT, fetch_feed
 from .llm import get_llm
+from .llm.prefilter import MIN_KEYWORDS, build_keyword_set, matches_keywords
 
 # Setup logging
 logging.basicConfig(
@@ -21,8 +28,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the project root directory."""
+    """Get the project root directory (resolved once per process)."""
+    # Explicit override skips the directory walk entirely
+    env_root = os.environ.get("AGENT_RSS_ROOT")
+    if env_root:
+        return Path(env_root)
     # Try to find the project root by looking for rss_list.md
     current = Path.cwd()
     for parent in [current] + list(current.parents):
@@ -65,9 +77,11 @@ def cli(ctx, config):
 @click.option("--dry-run", is_flag=True, help="Run without sending email")
 @click.option("--days", "-d", type=int, default=10, help="Only screen papers from the last N days (default: 10)")
 @click.option("--max-per-feed", "-m", type=int, default=0, help="Max papers to screen per feed (0=unlimited, useful for debug)")
+@click.option("--concurrency", "-j", type=int, default=10, help="Concurrent LLM screening requests (default: 10)")
+@click.option("--batch", is_flag=True, help="Submit screening as a provider batch job (50% cost, results within 24h); collect later with collect-batch")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.pass_context
-def run(ctx, dry_run, days, max_per_feed, verbose):
+def run(ctx, dry_run, days, max_per_feed, concurrency, batch, verbose):
     """Fetch feeds, screen papers, and send email notification."""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -115,21 +129,32 @@ def run(ctx, dry_run, days, max_per_feed, verbose):
 
     model = config["llm"].get("model")  # Optional, uses provider default if not set
     llm = get_llm(provider, api_key, model=model)
+    if config["llm"].get("semantic_cache", True):
+        llm.enable_semantic_cache()
+    llm.enable_prompt_cache(db)
+    llm.prepare(interests, examples)  # Render the static prompt prefix once
     click.echo(f"Using LLM: {provider}" + (f" ({model})" if model else ""))
 
-    # Fetch papers from all feeds, tracking group membership
-    # Build url -> group mapping
-    url_to_group = {}
-    for group, urls in feed_groups.items():
-        for url in urls:
-            url_to_group[url] = group
+    # Fetch papers from all feeds, tracking group membership.
+    # Precompute which groups get the relaxed relevance criteria
+    group_is_hq = {g: ('high' in g.lower() or 'quality' in g.lower()) for g in feed_groups}
 
+    # Fetch all feeds concurrently; this is pure network I/O and the
+    # second-largest wall-clock item after screening. feedparser has no
+    # per-request timeout, so bound the sockets or one stuck feed hangs
+    # the whole run (same as fetch_all_feeds)
+    socket.setdefaulttimeout(FETCH_TIMEOUT)
     all_papers = []
-    for group, urls in feed_groups.items():
-        for url in urls:
-            papers = fetch_feed(url)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {
+            executor.submit(fetch_feed, url, db): group
+            for group, urls in feed_groups.items()
+            for url in urls
+        }
+        for future in as_completed(futures):
+            papers = future.result()
             for p in papers:
-                p.feed_group = group  # Add group info to paper
+                p.feed_group = futures[future]  # Add group info to paper
             all_papers.extend(papers)
 
     click.echo(f"Fetched {len(all_papers)} total paper(s)")
@@ -149,8 +174,10 @@ def run(ctx, dry_run, days, max_per_feed, verbose):
     if skipped_old > 0:
         click.echo(f"Skipped {skipped_old} paper(s) older than {days} days")
 
-    # Filter unprocessed papers
-    new_papers = [p for p in recent_papers if not db.is_processed(p.link)]
+    # Filter unprocessed papers with one batched lookup instead of a
+    # SELECT per paper
+    unprocessed_links = set(db.filter_unprocessed([p.link for p in recent_papers]))
+    new_papers = [p for p in recent_papers if p.link in unprocessed_links]
     click.echo(f"Found {len(new_papers)} new paper(s) to screen (within {days} days)")
 
     # Limit papers per feed if specified (useful for debug mode)
@@ -166,71 +193,281 @@ def run(ctx, dry_run, days, max_per_feed, verbose):
             click.echo(f"Limited to {max_per_feed} paper(s) per feed: {len(limited_papers)} paper(s) to screen")
         new_papers = limited_papers
 
+    # Cheap keyword prefilter: papers from regular groups whose title and
+    # abstract share no token with the interests skip the LLM for this run.
+    # Only applied when the interests yield a rich enough keyword set; a
+    # terse interests.md would make the filter drop relevant papers that
+    # merely use different vocabulary. Skipped papers are NOT marked
+    # processed, so they get re-evaluated on later runs (e.g. after the
+    # interests are edited). High-quality groups always bypass the filter.
+    keywords = build_keyword_set(interests)
+    if len(keywords) >= MIN_KEYWORDS:
+        kept_papers = [
+            paper for paper in new_papers
+            if group_is_hq.get(paper.feed_group, False)
+            or matches_keywords(f"{paper.title} {paper.abstract}", keywords)
+        ]
+        skipped = len(new_papers) - len(kept_papers)
+        if skipped:
+            click.echo(f"Prefiltered {skipped} paper(s) with no keyword overlap (will recheck next run)")
+        new_papers = kept_papers
+
     if not new_papers:
         click.echo("No new papers to process")
         return
 
-    # Screen papers with group-based criteria
+    # Batch mode: submit one provider batch job and exit; results are
+    # collected later with the collect-batch command
+    if batch:
+        # Skip links already sitting in a pending batch job; rerunning
+        # before collect-batch must not pay for the same papers twice
+        in_flight = {
+            meta["link"]
+            for job in db.list_pending_batch_jobs()
+            for meta in json.loads(job["payload"])
+        }
+        if in_flight:
+            before = len(new_papers)
+            new_papers = [p for p in new_papers if p.link not in in_flight]
+            if len(new_papers) < before:
+                click.echo(f"Skipped {before - len(new_papers)} paper(s) already in a pending batch job")
+            if not new_papers:
+                click.echo("No new papers to submit")
+                return
+
+        prompts = []
+        payload = []
+        for i, paper in enumerate(new_papers):
+            prompts.append((
+                f"paper-{i}",
+                llm.build_prompt(paper.title, paper.authors, paper.abstract,
+                                  paper.source, interests, examples),
+            ))
+            payload.append({
+                "custom_id": f"paper-{i}",
+                "feed_url": paper.feed_url,
+                "link": paper.link,
+                "title": paper.title,
+                "authors": paper.authors,
+                "source": paper.source,
+                "group": paper.feed_group,
+            })
+        try:
+            job_id = llm.submit_batch(prompts)
+        except NotImplementedError as e:
+            click.echo(f"Error: {e}")
+            sys.exit(1)
+        db.save_batch_job(job_id, provider, json.dumps(payload))
+        click.echo(f"Submitted batch job {job_id} with {len(prompts)} paper(s)")
+        click.echo("Collect results later with: agent-rss collect-batch")
+        return
+
+    # Screen papers concurrently; LLM calls are pure network wait, so a
+    # bounded async pool pipelines them while respecting rate limits.
+    async def _screen_all(papers, progress):
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def screen_one(paper):
+            async with semaphore:
+                try:
+                    return await llm.screen_paper_async(
+                        title=paper.title,
+                        authors=paper.authors,
+                        abstract=paper.abstract,
+                        source=paper.source,
+                        interests=interests,
+                        examples=examples,
+                    )
+                except Exception as e:
+                    # Returned, not raised, so one failure doesn't cancel the batch
+                    return e
+                finally:
+                    progress.update(1)
+
+        return await asyncio.gather(*(screen_one(p) for p in papers))
+
+    click.echo(f"Screening {len(new_papers)} paper(s) (concurrency={concurrency})")
+    with click.progressbar(length=len(new_papers), label="Screening") as progress:
+        results = asyncio.run(_screen_all(new_papers, progress))
+
+    # Apply group-based criteria and record results serially, in input order
     # high-quality: field OR method match
     # other groups: field AND method match
     relevant_papers = []
-    for paper in new_papers:
-        group = getattr(paper, 'feed_group', url_to_group.get(paper.feed_url, 'default'))
-        click.echo(f"Screening [{group}]: {paper.title[:55]}...")
+    processed_rows = []  # Buffered for one batched DB write after the loop
+    status_lines = []  # Buffered and echoed once; avoids a stdout flush per paper
+    for paper, result in zip(new_papers, results):
+        # feed_group is always set at fetch time
+        group = paper.feed_group
+        status_lines.append(f"Screening [{group}]: {paper.title[:55]}...")
+        if isinstance(result, Exception):
+            logger.error(f"Error screening paper: {result}")
+            status_lines.append(f"  -> Error: {result}")
+            continue
+
+        # Apply group-specific criteria
+        if group_is_hq.get(group, False):
+            # High-quality: field OR method match
+            is_relevant = result.field_match or result.method_match
+        else:
+            # Other: field AND method match
+            is_relevant = result.field_match and result.method_match
+
+        processed_rows.append((
+            paper.feed_url,
+            paper.link,
+            paper.title,
+            paper.authors,
+            paper.source,
+            group,
+            is_relevant,
+            result.field_match,
+            result.method_match,
+            result.summary,
+        ))
+
+        # Show match status
+        match_status = f"F:{'✓' if result.field_match else '✗'} M:{'✓' if result.method_match else '✗'}"
+        if is_relevant:
+            relevant_papers.append({
+                "title": paper.title,
+                "source": paper.source,
+                "authors": paper.authors,
+                "link": paper.link,
+                "group": group,
+                "summary": result.summary,
+            })
+            status_lines.append(f"  -> [{match_status}] RELEVANT")
+        else:
+            status_lines.append(f"  -> [{match_status}] Skipped")
+
+    if status_lines:
+        click.echo("\n".join(status_lines))
+
+    # Flush all screening results in one transaction
+    db.mark_processed_batch(processed_rows)
+
+    click.echo(f"\nFound {len(relevant_papers)} relevant paper(s)")
+
+    # Send email
+    if relevant_papers and not dry_run:
+        email_config = config.get("email", {})
+        success = send_email(
+            smtp_server=email_config.get("smtp_server", "smtp.gmail.com"),
+            smtp_port=email_config.get("smtp_port", 587),
+            username=email_config.get("username"),
+            password=email_config.get("password"),
+            recipient=email_config.get("recipient"),
+            papers=relevant_papers,
+            sender_name=email_config.get("sender_name", "agent-rss"),
+        )
+        if success:
+            click.echo("Email notification sent!")
+        else:
+            click.echo("Failed to send email notification")
+    elif dry_run and relevant_papers:
+        click.echo("\n[DRY RUN] Would send email with:")
+        for p in relevant_papers:
+            click.echo(f"  - {p['title']}")
+
+
+@cli.command("collect-batch")
+@click.option("--job-id", default=None, help="Collect a specific job (default: all pending)")
+@click.option("--dry-run", is_flag=True, help="Show results without sending email")
+@click.pass_context
+def collect_batch(ctx, job_id, dry_run):
+    """Collect results of batch screening jobs submitted with run --batch."""
+    config = ctx.obj.get("config")
+
+    if not config:
+        click.echo("Error: No config.yaml found")
+        sys.exit(1)
+
+    db_path = config.get("database", {}).get("path", "~/.agent-rss/papers.db")
+    db = PaperDatabase(db_path)
+
+    if job_id:
+        job = db.get_batch_job(job_id)
+        if not job:
+            click.echo(f"Error: Unknown batch job: {job_id}")
+            sys.exit(1)
+        jobs = [job]
+    else:
+        jobs = db.list_pending_batch_jobs()
+        if not jobs:
+            click.echo("No pending batch jobs")
+            return
+
+    provider = config["llm"]["provider"]
+    api_key_map = {
+        "claude": config["api_keys"].get("anthropic"),
+        "openai": config["api_keys"].get("openai"),
+        "gemini": config["api_keys"].get("google"),
+    }
+    api_key = api_key_map.get(provider)
+
+    if not api_key or api_key.startswith("${"):
+        click.echo(f"Error: API key for {provider} not configured")
+        sys.exit(1)
+
+    llm = get_llm(provider, api_key, model=config["llm"].get("model"))
+
+    relevant_papers = []
+    for job in jobs:
+        click.echo(f"Checking batch job {job['job_id']}...")
         try:
-            result = llm.screen_paper(
-                title=paper.title,
-                authors=paper.authors,
-                abstract=paper.abstract,
-                source=paper.source,
-                interests=interests,
-                examples=examples,
-            )
-
-            # Apply group-specific criteria
+            responses = llm.fetch_batch(job["job_id"])
+        except Exception as e:
+            logger.error(f"Failed to fetch batch {job['job_id']}: {e}")
+            click.echo(f"  -> Error: {e}")
+            continue
+        if responses is None:
+            click.echo("  -> Still processing")
+            continue
+
+        rows = []
+        for meta in json.loads(job["payload"]):
+            response = responses.get(meta["custom_id"])
+            if response is None:
+                continue
+            result = llm.parse_response(response)
+            group = meta["group"]
+
+            # Same group-based criteria as the run command
             is_high_quality = 'high' in group.lower() or 'quality' in group.lower()
             if is_high_quality:
-                # High-quality: field OR method match
                 is_relevant = result.field_match or result.method_match
             else:
-                # Other: field AND method match
                 is_relevant = result.field_match and result.method_match
 
-            db.mark_processed(
-                feed_url=paper.feed_url,
-                paper_url=paper.link,
-                title=paper.title,
-                is_relevant=is_relevant,
-                summary=result.summary,
-                authors=paper.authors,
-                source=paper.source,
-                feed_group=group,
-                field_match=result.field_match,
-                method_match=result.method_match,
-            )
-
-            # Show match status
-            match_status = f"F:{'✓' if result.field_match else '✗'} M:{'✓' if result.method_match else '✗'}"
+            rows.append((
+                meta["feed_url"],
+                meta["link"],
+                meta["title"],
+                meta["authors"],
+                meta["source"],
+                group,
+                is_relevant,
+                result.field_match,
+                result.method_match,
+                result.summary,
+            ))
             if is_relevant:
                 relevant_papers.append({
-                    "title": paper.title,
-                    "source": paper.source,
-                    "authors": paper.authors,
-                    "link": paper.link,
+                    "title": meta["title"],
+                    "source": meta["source"],
+                    "authors": meta["authors"],
+                    "link": meta["link"],
                     "group": group,
                     "summary": result.summary,
                 })
-                click.echo(f"  -> [{match_status}] RELEVANT")
-            else:
-                click.echo(f"  -> [{match_status}] Skipped")
 
-        except Exception as e:
-            logger.error(f"Error screening paper: {e}")
-            click.echo(f"  -> Error: {e}")
+        db.mark_processed_batch(rows)
+        db.mark_batch_collected(job["job_id"])
+        click.echo(f"  -> Collected {len(rows)} result(s)")
 
     click.echo(f"\nFound {len(relevant_papers)} relevant paper(s)")
 
-    # Send email
     if relevant_papers and not dry_run:
         email_config = config.get("email", {})
         success = send_email(